@@ -11,6 +11,7 @@ from langchain_core.language_models import BaseLanguageModel
 from langchain_core.prompts import BasePromptTemplate, PromptTemplate
 from langchain_core.pydantic_v1 import Field
 from langchain_core.tools import BaseTool, Tool
+from langchain_core.utils.json import parse_json_markdown
 
 from langchain_community.agent_toolkits.openapi.planner_prompt import (
     API_CONTROLLER_PROMPT,
@@ -79,8 +80,6 @@ class RequestsGetToolWithParsing(BaseRequestsTool, BaseTool):
     """LLMChain used to extract the response."""
 
     def _run(self, text: str) -> str:
-        from langchain.output_parsers.json import parse_json_markdown
-
         try:
             data = parse_json_markdown(text)
         except json.JSONDecodeError as e:
@@ -113,8 +112,6 @@ class RequestsPostToolWithParsing(BaseRequestsTool, BaseTool):
     """LLMChain used to extract the response."""
 
     def _run(self, text: str) -> str:
-        from langchain.output_parsers.json import parse_json_markdown
-
         try:
             data = parse_json_markdown(text)
         except json.JSONDecodeError as e:
@@ -144,8 +141,6 @@ class RequestsPatchToolWithParsing(BaseRequestsTool, BaseTool):
     """LLMChain used to extract the response."""
 
     def _run(self, text: str) -> str:
-        from langchain.output_parsers.json import parse_json_markdown
-
         try:
             data = parse_json_markdown(text)
         except json.JSONDecodeError as e:
@@ -177,8 +172,6 @@ class RequestsPutToolWithParsing(BaseRequestsTool, BaseTool):
     """LLMChain used to extract the response."""
 
     def _run(self, text: str) -> str:
-        from langchain.output_parsers.json import parse_json_markdown
-
         try:
             data = parse_json_markdown(text)
         except json.JSONDecodeError as e:
@@ -209,8 +202,6 @@ class RequestsDeleteToolWithParsing(BaseRequestsTool, BaseTool):
     """The LLM chain used to parse the response."""
 
     def _run(self, text: str) -> str:
-        from langchain.output_parsers.json import parse_json_markdown
-
         try:
             data = parse_json_markdown(text)
         except json.JSONDecodeError as e:
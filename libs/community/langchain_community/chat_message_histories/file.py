@@ -1,6 +1,9 @@
 import json
+import os
+import stat
 from pathlib import Path
-from typing import List
+from tempfile import NamedTemporaryFile
+from typing import IO, List, Optional, Sequence
 
 from langchain_core.chat_history import (
     BaseChatMessageHistory,
@@ -9,7 +12,13 @@ from langchain_core.messages import BaseMessage, messages_from_dict, messages_to
 
 
 class FileChatMessageHistory(BaseChatMessageHistory):
-    """Chat message history that stores history in a local file."""
+    """Chat message history that stores history in a local file.
+
+    Messages are stored as a JSON Lines append log (one message per line),
+    so adding a message appends a single line instead of rewriting the whole
+    history. Files written by older versions, which stored the history as one
+    JSON array, are read transparently and migrated on the first write.
+    """
 
     def __init__(self, file_path: str) -> None:
         """Initialize the file path for the chat history.
@@ -18,23 +27,98 @@ class FileChatMessageHistory(BaseChatMessageHistory):
             file_path: The path to the local file to store the chat history.
         """
         self.file_path = Path(file_path)
+        # Append handle kept open across writes so each append does not pay
+        # an open/close round trip. Opened lazily on the first append.
+        self._append_handle: Optional[IO[str]] = None
+        # Whether the file is in the JSON Lines append-log format (as opposed
+        # to the legacy JSON-array format). Detected lazily on first use and
+        # kept up to date by the write paths; only this class writes the file.
+        self._is_append_log: Optional[bool] = None
         if not self.file_path.exists():
             self.file_path.touch()
-            self.file_path.write_text(json.dumps([]))
+            self._is_append_log = True
 
     @property
     def messages(self) -> List[BaseMessage]:  # type: ignore
         """Retrieve the messages from the local file"""
-        items = json.loads(self.file_path.read_text())
-        messages = messages_from_dict(items)
-        return messages
+        return messages_from_dict(self._read_items())
+
+    def _uses_append_log(self) -> bool:
+        """Return whether the file is in the append-log format.
+
+        Only the leading bytes are inspected, so this stays O(1) in the size
+        of the history; the result is cached for subsequent calls.
+        """
+        if self._is_append_log is None:
+            with self.file_path.open("rb") as f:
+                head = f.read(64)
+            # Legacy JSON-array files start with '['; empty files and JSON
+            # Lines files do not.
+            self._is_append_log = not head.lstrip().startswith(b"[")
+        return self._is_append_log
+
+    def _read_items(self) -> List[dict]:
+        """Read the stored message dicts, handling both file formats."""
+        text = self.file_path.read_text()
+        stripped = text.lstrip()
+        if not stripped:
+            return []
+        if stripped.startswith("["):
+            # Legacy format: the entire history as a single JSON array.
+            return json.loads(stripped)
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
 
     def add_message(self, message: BaseMessage) -> None:
         """Append the message to the record in the local file"""
-        messages = messages_to_dict(self.messages)
-        messages.append(messages_to_dict([message])[0])
-        self.file_path.write_text(json.dumps(messages))
+        self.add_messages([message])
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Append a batch of messages to the record in a single write."""
+        new_items = messages_to_dict(messages)
+        if not self._uses_append_log():
+            # Migrate a legacy JSON-array file to the append log once;
+            # subsequent writes are plain appends.
+            self._write(self._read_items() + new_items)
+            return
+        # Serialize everything before touching the file so the append is a
+        # single write of the fully rendered batch.
+        data = "".join(json.dumps(item) + "\n" for item in new_items)
+        if self._append_handle is None or self._append_handle.closed:
+            self._append_handle = self.file_path.open("a")
+        self._append_handle.write(data)
+        # Flush so that the messages property and other readers of the file
+        # observe the append immediately.
+        self._append_handle.flush()
 
     def clear(self) -> None:
         """Clear session memory from the local file"""
-        self.file_path.write_text(json.dumps([]))
+        self._write([])
+
+    def _write(self, items: List[dict]) -> None:
+        """Atomically replace the history file with the given message dicts.
+
+        Writing to a temporary file in the same directory and renaming it over
+        the history file ensures that concurrent readers never observe a
+        partially written history.
+        """
+        # The replace below swaps the file's inode; a cached append handle
+        # would keep writing to the replaced file, so close it first.
+        if self._append_handle is not None:
+            self._append_handle.close()
+            self._append_handle = None
+        mode = stat.S_IMODE(self.file_path.stat().st_mode)
+        data = "".join(json.dumps(item) + "\n" for item in items)
+        with NamedTemporaryFile(
+            mode="w", dir=self.file_path.parent, delete=False
+        ) as temp_file:
+            temp_file.write(data)
+        # NamedTemporaryFile creates files with mode 0600; keep the history
+        # file's existing permissions instead.
+        os.chmod(temp_file.name, mode)
+        os.replace(temp_file.name, self.file_path)
+        self._is_append_log = True
+
+    def __del__(self) -> None:
+        handle = getattr(self, "_append_handle", None)
+        if handle is not None:
+            handle.close()
@@ -1,9 +1,10 @@
+import json
 import tempfile
 from pathlib import Path
 from typing import Generator
 
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, messages_to_dict
 
 from langchain_community.chat_message_histories import FileChatMessageHistory
 
@@ -69,3 +70,71 @@ def test_multiple_sessions(file_chat_message_history: FileChatMessageHistory) ->
     assert messages[2].content == "Tell me a joke."
     expected_content = "Why did the chicken cross the road? To get to the other side!"
     assert messages[3].content == expected_content
+
+
+def test_jsonl_round_trip(file_chat_message_history: FileChatMessageHistory) -> None:
+    # Messages are stored one JSON object per line and survive reloading
+    # through a fresh instance.
+    file_chat_message_history.add_user_message("Hello!")
+    file_chat_message_history.add_ai_message("Hi there!")
+
+    lines = [
+        line
+        for line in file_chat_message_history.file_path.read_text().splitlines()
+        if line.strip()
+    ]
+    assert len(lines) == 2
+    assert all(line.lstrip().startswith("{") for line in lines)
+
+    reloaded = FileChatMessageHistory(str(file_chat_message_history.file_path))
+    messages = reloaded.messages
+    assert len(messages) == 2
+    assert messages[0].content == "Hello!"
+    assert messages[1].content == "Hi there!"
+
+
+def test_read_legacy_array_file() -> None:
+    # Files written by older versions stored the history as one JSON array.
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "test_chat_history.json"
+        items = messages_to_dict([HumanMessage(content="Hello!")])
+        file_path.write_text(json.dumps(items))
+
+        history = FileChatMessageHistory(str(file_path))
+        messages = history.messages
+        assert len(messages) == 1
+        assert isinstance(messages[0], HumanMessage)
+        assert messages[0].content == "Hello!"
+
+
+def test_legacy_array_file_migrated_on_write() -> None:
+    # The first write to a legacy JSON-array file migrates it to the
+    # append-log format without losing the existing messages.
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "test_chat_history.json"
+        items = messages_to_dict([HumanMessage(content="Hello!")])
+        file_path.write_text(json.dumps(items))
+
+        history = FileChatMessageHistory(str(file_path))
+        history.add_ai_message("Hi there!")
+
+        assert not file_path.read_text().lstrip().startswith("[")
+        messages = FileChatMessageHistory(str(file_path)).messages
+        assert len(messages) == 2
+        assert messages[0].content == "Hello!"
+        assert messages[1].content == "Hi there!"
+
+
+def test_clear_then_append(
+    file_chat_message_history: FileChatMessageHistory,
+) -> None:
+    # clear() replaces the file; subsequent appends must land in the new
+    # file rather than the replaced one.
+    file_chat_message_history.add_user_message("Hello!")
+    file_chat_message_history.clear()
+    file_chat_message_history.add_ai_message("Hi there!")
+
+    messages = file_chat_message_history.messages
+    assert len(messages) == 1
+    assert isinstance(messages[0], AIMessage)
+    assert messages[0].content == "Hi there!"
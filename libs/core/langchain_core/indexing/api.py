@@ -304,11 +304,18 @@ def index(
     num_skipped = 0
     num_updated = 0
     num_deleted = 0
+    # Uids already written to the record manager during this run. Documents
+    # that reappear in later batches are known to exist, so they can skip
+    # the existence query against the record manager.
+    uids_this_run: Set[str] = set()
 
     for doc_batch in _batch(batch_size, doc_iterator):
+        # Feed the hashed documents to the deduplicator as a generator so the
+        # batch is hashed, deduplicated, and collected in one pass without an
+        # intermediate list.
         hashed_docs = list(
             _deduplicate_in_order(
-                [_HashedDocument.from_document(doc) for doc in doc_batch]
+                _HashedDocument.from_document(doc) for doc in doc_batch
             )
         )
 
@@ -329,7 +336,14 @@ def index(
             # source ids cannot be None after for loop above.
             source_ids = cast(Sequence[str], source_ids)  # type: ignore[assignment]
 
-        exists_batch = record_manager.exists([doc.uid for doc in hashed_docs])
+        uids_batch = [doc.uid for doc in hashed_docs]
+        unseen_uids = [uid for uid in uids_batch if uid not in uids_this_run]
+        exists_map = (
+            dict(zip(unseen_uids, record_manager.exists(unseen_uids)))
+            if unseen_uids
+            else {}
+        )
+        exists_batch = [exists_map.get(uid, True) for uid in uids_batch]
 
         # Filter out documents that already exist in the record store.
         uids = []
@@ -362,10 +376,11 @@ def index(
         # Update ALL records, even if they already exist since we want to refresh
         # their timestamp.
         record_manager.update(
-            [doc.uid for doc in hashed_docs],
+            uids_batch,
             group_ids=source_ids,
             time_at_least=index_start_dt,
         )
+        uids_this_run.update(uids_batch)
 
         # If source IDs are provided, we can do the deletion incrementally!
         if cleanup == "incremental":
@@ -527,11 +542,18 @@ async def aindex(
     num_skipped = 0
     num_updated = 0
     num_deleted = 0
+    # Uids already written to the record manager during this run. Documents
+    # that reappear in later batches are known to exist, so they can skip
+    # the existence query against the record manager.
+    uids_this_run: Set[str] = set()
 
     async for doc_batch in _abatch(batch_size, async_doc_iterator):
+        # Feed the hashed documents to the deduplicator as a generator so the
+        # batch is hashed, deduplicated, and collected in one pass without an
+        # intermediate list.
         hashed_docs = list(
             _deduplicate_in_order(
-                [_HashedDocument.from_document(doc) for doc in doc_batch]
+                _HashedDocument.from_document(doc) for doc in doc_batch
             )
         )
 
@@ -552,7 +574,14 @@ async def aindex(
             # source ids cannot be None after for loop above.
             source_ids = cast(Sequence[str], source_ids)
 
-        exists_batch = await record_manager.aexists([doc.uid for doc in hashed_docs])
+        uids_batch = [doc.uid for doc in hashed_docs]
+        unseen_uids = [uid for uid in uids_batch if uid not in uids_this_run]
+        exists_map = (
+            dict(zip(unseen_uids, await record_manager.aexists(unseen_uids)))
+            if unseen_uids
+            else {}
+        )
+        exists_batch = [exists_map.get(uid, True) for uid in uids_batch]
 
         # Filter out documents that already exist in the record store.
         uids: list[str] = []
@@ -587,10 +616,11 @@ async def aindex(
         # Update ALL records, even if they already exist since we want to refresh
         # their timestamp.
         await record_manager.aupdate(
-            [doc.uid for doc in hashed_docs],
+            uids_batch,
             group_ids=source_ids,
             time_at_least=index_start_dt,
         )
+        uids_this_run.update(uids_batch)
 
         # If source IDs are provided, we can do the deletion incrementally!
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Sequence, TypedDict
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, TypedDict
 
 
 class RecordManager(ABC):
@@ -218,9 +218,18 @@ class RecordManager(ABC):
         """
 
 
-class _Record(TypedDict):
-    group_id: Optional[str]
-    updated_at: float
+class _Record:
+    """Bookkeeping entry for a single key.
+
+    Uses ``__slots__`` rather than a per-record dict to keep the memory
+    footprint of large in-memory indexes small.
+    """
+
+    __slots__ = ("group_id", "updated_at")
+
+    def __init__(self, group_id: Optional[str], updated_at: float) -> None:
+        self.group_id = group_id
+        self.updated_at = updated_at
 
 
 class InMemoryRecordManager(RecordManager):
@@ -233,9 +242,25 @@ class InMemoryRecordManager(RecordManager):
             namespace (str): The namespace for the record manager.
         """
         super().__init__(namespace)
-        # Each key points to a dictionary
-        # of {'group_id': group_id, 'updated_at': timestamp}
+        # Each key points to a record holding its group id and the
+        # timestamp of the last update.
         self.records: Dict[str, _Record] = {}
+        # Inverted index from group id to the keys in that group. Kept in
+        # sync with `records` so that group filters in `list_keys` use set
+        # lookups instead of scanning the group ids of every record.
+        self._keys_by_group: Dict[Optional[str], Set[str]] = {}
+        # Memoized list_keys results keyed by the frozen filter arguments.
+        # Cleared on every mutation, so repeated queries between writes are
+        # answered without re-walking the records.
+        self._list_keys_cache: Dict[
+            Tuple[
+                Optional[FrozenSet[str]],
+                Optional[float],
+                Optional[float],
+                Optional[int],
+            ],
+            List[str],
+        ] = {}
         self.namespace = namespace
 
     def create_schema(self) -> None:
@@ -284,11 +309,16 @@ class InMemoryRecordManager(RecordManager):
 
         if group_ids and len(keys) != len(group_ids):
             raise ValueError("Length of keys must match length of group_ids")
+        self._list_keys_cache.clear()
         for index, key in enumerate(keys):
             group_id = group_ids[index] if group_ids else None
             if time_at_least and time_at_least > self.get_time():
                 raise ValueError("time_at_least must be in the past")
-            self.records[key] = {"group_id": group_id, "updated_at": self.get_time()}
+            old_record = self.records.get(key)
+            if old_record is not None and old_record.group_id != group_id:
+                self._keys_by_group[old_record.group_id].discard(key)
+            self.records[key] = _Record(group_id=group_id, updated_at=self.get_time())
+            self._keys_by_group.setdefault(group_id, set()).add(key)
 
     async def aupdate(
         self,
@@ -364,17 +394,42 @@ class InMemoryRecordManager(RecordManager):
         Returns:
             A list of keys for the matching records.
         """
-        result = []
-        for key, data in self.records.items():
-            if before and data["updated_at"] >= before:
-                continue
-            if after and data["updated_at"] <= after:
-                continue
-            if group_ids and data["group_id"] not in group_ids:
-                continue
-            result.append(key)
+        cache_key = (
+            frozenset(group_ids) if group_ids else None,
+            before,
+            after,
+            limit,
+        )
+        cached = self._list_keys_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        if not (group_ids or before or after):
+            # No filters: the result is just the keys in insertion order.
+            result = list(self.records)
+        else:
+            if group_ids:
+                # Use the inverted index to resolve the group filter up front;
+                # iteration over `records` below preserves insertion order.
+                candidate_keys: Optional[Set[str]] = set().union(
+                    *(
+                        self._keys_by_group.get(group_id, set())
+                        for group_id in group_ids
+                    )
+                )
+            else:
+                candidate_keys = None
+            result = [
+                key
+                for key, data in self.records.items()
+                if (candidate_keys is None or key in candidate_keys)
+                and (not before or data.updated_at < before)
+                and (not after or data.updated_at > after)
+            ]
         if limit:
-            return result[:limit]
+            result = result[:limit]
+        # Store a copy so callers mutating the returned list do not corrupt
+        # the cache.
+        self._list_keys_cache[cache_key] = list(result)
         return result
 
     async def alist_keys(
@@ -410,9 +465,11 @@ class InMemoryRecordManager(RecordManager):
         Args:
             keys: A list of keys to delete.
         """
+        self._list_keys_cache.clear()
         for key in keys:
-            if key in self.records:
-                del self.records[key]
+            record = self.records.pop(key, None)
+            if record is not None:
+                self._keys_by_group[record.group_id].discard(key)
 
     async def adelete_keys(self, keys: Sequence[str]) -> None:
         """Async delete specified records from the database.
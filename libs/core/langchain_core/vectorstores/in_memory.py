@@ -58,17 +58,32 @@ class InMemoryVectorStore(VectorStore):
         self.delete(ids)
 
     def upsert(self, items: Sequence[Document], /, **kwargs: Any) -> UpsertResponse:
-        vectors = self.embedding.embed_documents([item.page_content for item in items])
         ids = []
-        for item, vector in zip(items, vectors):
+        items_to_embed: List[Tuple[str, Document]] = []
+        for item in items:
             doc_id = item.id if item.id else str(uuid.uuid4())
             ids.append(doc_id)
-            self.store[doc_id] = {
-                "id": doc_id,
-                "vector": vector,
-                "text": item.page_content,
-                "metadata": item.metadata,
-            }
+            existing = self.store.get(doc_id)
+            if (
+                existing is not None
+                and existing["text"] == item.page_content
+                and existing["metadata"] == item.metadata
+            ):
+                # Content is unchanged, so the stored vector is still valid;
+                # skip re-embedding the document.
+                continue
+            items_to_embed.append((doc_id, item))
+        if items_to_embed:
+            vectors = self.embedding.embed_documents(
+                [item.page_content for _, item in items_to_embed]
+            )
+            for (doc_id, item), vector in zip(items_to_embed, vectors):
+                self.store[doc_id] = {
+                    "id": doc_id,
+                    "vector": vector,
+                    "text": item.page_content,
+                    "metadata": item.metadata,
+                }
         return {
             "succeeded": ids,
             "failed": [],
@@ -288,8 +303,14 @@ class InMemoryVectorStore(VectorStore):
             A VectorStore object.
         """
         _path: Path = Path(path)
-        with _path.open("r") as f:
-            store = load(json.load(f))
+        try:
+            import orjson
+        except ImportError:
+            with _path.open("r") as f:
+                serialized = json.load(f)
+        else:
+            serialized = orjson.loads(_path.read_bytes())
+        store = load(serialized)
         vectorstore = cls(embedding=embedding, **kwargs)
         vectorstore.store = store
         return vectorstore
@@ -302,5 +323,17 @@ class InMemoryVectorStore(VectorStore):
         """
         _path: Path = Path(path)
         _path.parent.mkdir(exist_ok=True, parents=True)
-        with _path.open("w") as f:
-            json.dump(dumpd(self.store), f, indent=2)
+        serialized = dumpd(self.store)
+        try:
+            import orjson
+        except ImportError:
+            with _path.open("w") as f:
+                json.dump(serialized, f, indent=2)
+        else:
+            # OPT_NON_STR_KEYS matches the stdlib behavior of coercing
+            # non-string metadata keys instead of raising.
+            _path.write_bytes(
+                orjson.dumps(
+                    serialized, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
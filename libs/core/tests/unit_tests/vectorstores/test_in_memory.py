@@ -95,3 +95,38 @@ async def test_inmemory_filter() -> None:
         "baz", filter=lambda doc: doc.metadata["id"] == 1
     )
     assert output == [Document(page_content="foo", metadata={"id": 1}, id=AnyStr())]
+
+
+class _CallCountingEmbeddings(DeterministicFakeEmbedding):
+    """Fake embeddings that record each embed_documents call."""
+
+    calls: list = []
+
+    def embed_documents(self, texts: list) -> list:
+        self.calls.append(list(texts))
+        return super().embed_documents(texts)
+
+
+def test_upsert_skips_unchanged_documents() -> None:
+    embedding = _CallCountingEmbeddings(size=6)
+    store = InMemoryVectorStore(embedding=embedding)
+    docs = [
+        Document(page_content="foo", metadata={"id": 1}, id="1"),
+        Document(page_content="bar", metadata={"id": 2}, id="2"),
+    ]
+
+    store.upsert(docs)
+    assert embedding.calls == [["foo", "bar"]]
+
+    # Re-upserting identical documents must not call the embedder again.
+    store.upsert(docs)
+    assert embedding.calls == [["foo", "bar"]]
+
+    # Changed text re-embeds only the changed document.
+    store.upsert([Document(page_content="foo2", metadata={"id": 1}, id="1")])
+    assert embedding.calls == [["foo", "bar"], ["foo2"]]
+
+    # Changed metadata also re-embeds, since filters rely on stored metadata.
+    store.upsert([Document(page_content="bar", metadata={"id": 20}, id="2")])
+    assert embedding.calls == [["foo", "bar"], ["foo2"], ["bar"]]
+    assert store.store["2"]["metadata"] == {"id": 20}
@@ -13,7 +13,7 @@ import hashlib
 import json
 import uuid
 from functools import partial
-from typing import Callable, List, Optional, Sequence, Union, cast
+from typing import Callable, List, Literal, Optional, Sequence, Union, cast
 
 from langchain_core.embeddings import Embeddings
 from langchain_core.stores import BaseStore, ByteStore
@@ -35,9 +35,19 @@ def _key_encoder(key: str, namespace: str) -> str:
     return namespace + str(_hash_string_to_uuid(key))
 
 
-def _create_key_encoder(namespace: str) -> Callable[[str], str]:
-    """Create an encoder for a key."""
-    return partial(_key_encoder, namespace=namespace)
+def _create_key_encoder(
+    namespace: str, algorithm: str = "sha1"
+) -> Callable[[str], str]:
+    """Create an encoder that hashes keys with the given hashlib algorithm."""
+    if algorithm == "sha1":
+        # Historical default; produces the same keys as existing caches.
+        return partial(_key_encoder, namespace=namespace)
+
+    def _encode(key: str) -> str:
+        digest = hashlib.new(algorithm, key.encode("utf-8")).hexdigest()
+        return namespace + str(uuid.uuid5(NAMESPACE_UUID, digest))
+
+    return _encode
 
 
 def _value_serializer(value: Sequence[float]) -> bytes:
@@ -233,6 +243,9 @@ class CacheBackedEmbeddings(Embeddings):
         namespace: str = "",
         batch_size: Optional[int] = None,
         query_embedding_cache: Union[bool, ByteStore] = False,
+        key_encoder: Union[
+            Callable[[str], str], Literal["sha1", "blake2b", "sha256", "sha512"]
+        ] = "sha1",
     ) -> CacheBackedEmbeddings:
         """On-ramp that adds the necessary serialization and encoding to the store.
 
@@ -247,12 +260,28 @@ class CacheBackedEmbeddings(Embeddings):
             query_embedding_cache: The cache to use for storing query embeddings.
                 True to use the same cache as document embeddings.
                 False to not cache query embeddings.
+            key_encoder: The hash algorithm used to derive cache keys from texts,
+                or a custom callable mapping a text to its cache key. Defaults to
+                "sha1" for compatibility with existing caches; "blake2b" is
+                faster on long texts. Changing the encoder invalidates keys
+                written by previously configured caches. A custom callable
+                receives the raw text and its return value is used as the key
+                verbatim -- the namespace is NOT prepended, so the callable
+                must incorporate it itself if namespacing is desired.
         """
         namespace = namespace
-        key_encoder = _create_key_encoder(namespace)
+        if callable(key_encoder):
+            _encoder = key_encoder
+        elif key_encoder in ("sha1", "blake2b", "sha256", "sha512"):
+            _encoder = _create_key_encoder(namespace, key_encoder)
+        else:
+            raise ValueError(
+                f"Unsupported key encoder: {key_encoder}. Should be one of "
+                f"'sha1', 'blake2b', 'sha256', 'sha512' or a callable."
+            )
         document_embedding_store = EncoderBackedStore[str, List[float]](
             document_embedding_cache,
-            key_encoder,
+            _encoder,
             _value_serializer,
             _value_deserializer,
         )
@@ -263,7 +292,7 @@ class CacheBackedEmbeddings(Embeddings):
         else:
             query_embedding_store = EncoderBackedStore[str, List[float]](
                 query_embedding_cache,
-                key_encoder,
+                _encoder,
                 _value_serializer,
                 _value_deserializer,
             )
@@ -17,7 +17,17 @@ allow it to work with a variety of SQL as a backend.
 import contextlib
 import decimal
 import uuid
-from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 from langchain_core.indexing import RecordManager
 from sqlalchemy import (
@@ -48,6 +58,10 @@ except ImportError:
 
 Base = declarative_base()
 
+# Number of keys per IN clause in bulk existence checks. Kept safely below
+# the 999 bound-parameter limit of older SQLite builds.
+_EXISTS_BATCH_SIZE = 500
+
 
 class UpsertionRecord(Base):  # type: ignore[valid-type,misc]
     """Table used to keep track of when a key was last updated."""
@@ -405,36 +419,45 @@ class SQLRecordManager(RecordManager):
 
     def exists(self, keys: Sequence[str]) -> List[bool]:
         """Check if the given keys exist in the SQLite database."""
+        found_keys: Set[str] = set()
         session: Session
         with self._make_session() as session:
-            filtered_query: Query = session.query(UpsertionRecord.key).filter(
-                and_(
-                    UpsertionRecord.key.in_(keys),
-                    UpsertionRecord.namespace == self.namespace,
+            # Query in chunks so large batches stay under the backend's
+            # bound-parameter limit (999 in older SQLite builds).
+            for start in range(0, len(keys), _EXISTS_BATCH_SIZE):
+                chunk = keys[start : start + _EXISTS_BATCH_SIZE]
+                filtered_query: Query = session.query(UpsertionRecord.key).filter(
+                    and_(
+                        UpsertionRecord.key.in_(chunk),
+                        UpsertionRecord.namespace == self.namespace,
+                    )
                 )
-            )
-            records = filtered_query.all()
-        found_keys = set(r.key for r in records)
+                found_keys.update(r.key for r in filtered_query.all())
         return [k in found_keys for k in keys]
 
     async def aexists(self, keys: Sequence[str]) -> List[bool]:
         """Check if the given keys exist in the SQLite database."""
+        found_keys: Set[str] = set()
         async with self._amake_session() as session:
-            records = (
-                (
-                    await session.execute(
-                        select(UpsertionRecord.key).where(
-                            and_(
-                                UpsertionRecord.key.in_(keys),
-                                UpsertionRecord.namespace == self.namespace,
+            # Query in chunks so large batches stay under the backend's
+            # bound-parameter limit (999 in older SQLite builds).
+            for start in range(0, len(keys), _EXISTS_BATCH_SIZE):
+                chunk = keys[start : start + _EXISTS_BATCH_SIZE]
+                records = (
+                    (
+                        await session.execute(
+                            select(UpsertionRecord.key).where(
+                                and_(
+                                    UpsertionRecord.key.in_(chunk),
+                                    UpsertionRecord.namespace == self.namespace,
+                                )
                             )
                         )
                     )
+                    .scalars()
+                    .all()
                 )
-                .scalars()
-                .all()
-            )
-        found_keys = set(records)
+                found_keys.update(records)
         return [k in found_keys for k in keys]
 
     def list_keys(
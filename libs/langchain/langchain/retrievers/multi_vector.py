@@ -78,9 +78,11 @@ class MultiVectorRetriever(BaseRetriever):
 
         # We do this to maintain the order of the ids that are returned
         ids = []
+        seen_ids = set()
         for d in sub_docs:
-            if self.id_key in d.metadata and d.metadata[self.id_key] not in ids:
+            if self.id_key in d.metadata and d.metadata[self.id_key] not in seen_ids:
                 ids.append(d.metadata[self.id_key])
+                seen_ids.add(d.metadata[self.id_key])
         docs = self.docstore.mget(ids)
         return [d for d in docs if d is not None]
 
@@ -112,8 +114,10 @@ class MultiVectorRetriever(BaseRetriever):
 
         # We do this to maintain the order of the ids that are returned
         ids = []
+        seen_ids = set()
         for d in sub_docs:
-            if self.id_key in d.metadata and d.metadata[self.id_key] not in ids:
+            if self.id_key in d.metadata and d.metadata[self.id_key] not in seen_ids:
                 ids.append(d.metadata[self.id_key])
+                seen_ids.add(d.metadata[self.id_key])
         docs = await self.docstore.amget(ids)
         return [d for d in docs if d is not None]
@@ -22,6 +22,7 @@ from langchain.storage.file_system import LocalFileStore
 if TYPE_CHECKING:
     from langchain_community.storage import (
         RedisStore,
+        SQLStore,
         UpstashRedisByteStore,
         UpstashRedisStore,
     )
@@ -35,7 +36,13 @@ DEPRECATED_LOOKUP = {
     "UpstashRedisStore": "langchain_community.storage",
 }
 
-_import_attribute = create_importer(__package__, deprecated_lookups=DEPRECATED_LOOKUP)
+_MODULE_LOOKUP = {
+    "SQLStore": "langchain_community.storage",
+}
+
+_import_attribute = create_importer(
+    __package__, deprecated_lookups=DEPRECATED_LOOKUP, module_lookup=_MODULE_LOOKUP
+)
 
 
 def __getattr__(name: str) -> Any:
@@ -52,6 +59,7 @@ __all__ = [
     "InvalidKeyException",
     "LocalFileStore",
     "RedisStore",
+    "SQLStore",
     "UpstashRedisByteStore",
     "UpstashRedisStore",
 ]
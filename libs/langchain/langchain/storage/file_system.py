@@ -1,8 +1,9 @@
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, List, Optional, Sequence, Tuple, Union
+from typing import Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from langchain_core.stores import ByteStore
 
@@ -44,6 +45,7 @@ class LocalFileStore(ByteStore):
         chmod_file: Optional[int] = None,
         chmod_dir: Optional[int] = None,
         update_atime: bool = False,
+        max_concurrency: Optional[int] = None,
     ) -> None:
         """Implement the BaseStore interface for the local file system.
 
@@ -58,11 +60,20 @@ class LocalFileStore(ByteStore):
                 filesystem access time (but not the modified time) when a file is read.
                 This allows MRU/LRU cache policies to be implemented for filesystems
                 where access time updates are disabled.
+            max_concurrency: (optional, defaults to `None`) If specified, writes
+                the values of an `mset` batch from a thread pool with this many
+                workers. File writes release the GIL, so this overlaps the
+                per-file I/O latency of large batches of small values.
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be a positive integer, got {max_concurrency}."
+            )
         self.root_path = Path(root_path).absolute()
         self.chmod_file = chmod_file
         self.chmod_dir = chmod_dir
         self.update_atime = update_atime
+        self.max_concurrency = max_concurrency
 
     def _get_full_path(self, key: str) -> Path:
         """Get the full path for a given key relative to the root path.
@@ -116,14 +127,18 @@ class LocalFileStore(ByteStore):
         values: List[Optional[bytes]] = []
         for key in keys:
             full_path = self._get_full_path(key)
-            if full_path.exists():
+            try:
+                # Read directly instead of checking existence first; this
+                # saves a stat() per key and avoids the race between the
+                # check and the read.
                 value = full_path.read_bytes()
-                values.append(value)
-                if self.update_atime:
-                    # update access time only; preserve modified time
-                    os.utime(full_path, (time.time(), os.stat(full_path).st_mtime))
-            else:
+            except FileNotFoundError:
                 values.append(None)
+                continue
+            values.append(value)
+            if self.update_atime:
+                # update access time only; preserve modified time
+                os.utime(full_path, (time.time(), os.stat(full_path).st_mtime))
         return values
 
     def mset(self, key_value_pairs: Sequence[Tuple[str, bytes]]) -> None:
@@ -135,12 +150,36 @@ class LocalFileStore(ByteStore):
         Returns:
             None
         """
-        for key, value in key_value_pairs:
-            full_path = self._get_full_path(key)
-            self._mkdir_for_store(full_path.parent)
-            full_path.write_bytes(value)
-            if self.chmod_file is not None:
-                os.chmod(full_path, self.chmod_file)
+        # Collapse duplicate keys so each file is written once per batch; the
+        # last value wins, matching what sequential overwrites would leave
+        # behind, and concurrent writers never race on the same path.
+        # Then resolve and validate all paths up front so that a batch either
+        # starts writing with every key validated or fails before any I/O.
+        full_paths = [
+            (self._get_full_path(key), value)
+            for key, value in dict(key_value_pairs).items()
+        ]
+        # Directories are typically shared between keys in a batch; ensure each
+        # parent directory only once instead of stat-ing it for every key.
+        dirs_made: Set[Path] = set()
+        for full_path, _ in full_paths:
+            parent = full_path.parent
+            if parent not in dirs_made:
+                self._mkdir_for_store(parent)
+                dirs_made.add(parent)
+        if self.max_concurrency is not None and len(full_paths) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                # Consume the iterator so write errors propagate to the caller.
+                list(executor.map(lambda args: self._write_file(*args), full_paths))
+        else:
+            for full_path, value in full_paths:
+                self._write_file(full_path, value)
+
+    def _write_file(self, full_path: Path, value: bytes) -> None:
+        """Write a single value to its resolved path, applying permissions."""
+        full_path.write_bytes(value)
+        if self.chmod_file is not None:
+            os.chmod(full_path, self.chmod_file)
 
     def mdelete(self, keys: Sequence[str]) -> None:
         """Delete the given keys and their associated values.
@@ -148,3 +148,56 @@ async def test_aembed_query_cached(
     keys = list(cache_embeddings_with_query.query_embedding_store.yield_keys())  # type: ignore[union-attr]
     assert len(keys) == 1
     assert keys[0] == "test_namespace89ec3dae-a4d9-5636-a62e-ff3b56cdfa15"
+
+
+def test_sha1_key_encoder_default() -> None:
+    """The default sha1 encoder must keep producing the historical keys."""
+    store = InMemoryStore()
+    cache = CacheBackedEmbeddings.from_bytes_store(
+        MockEmbeddings(), store, namespace="test_namespace", key_encoder="sha1"
+    )
+    cache.embed_documents(["1"])
+    keys = list(cache.document_embedding_store.yield_keys())
+    # Same key as caches written before key_encoder existed.
+    assert keys == ["test_namespace812b86c1-8ebf-5483-95c6-c95cf2b52d12"]
+
+
+def test_blake2b_key_encoder() -> None:
+    """A non-default algorithm produces stable keys distinct from sha1's."""
+
+    def _keys_for(texts: List[str]) -> List[str]:
+        store = InMemoryStore()
+        cache = CacheBackedEmbeddings.from_bytes_store(
+            MockEmbeddings(), store, namespace="test_namespace", key_encoder="blake2b"
+        )
+        cache.embed_documents(texts)
+        return list(cache.document_embedding_store.yield_keys())
+
+    keys = _keys_for(["1"])
+    assert keys[0].startswith("test_namespace")
+    assert keys[0] != "test_namespace812b86c1-8ebf-5483-95c6-c95cf2b52d12"
+    # Deterministic across instances.
+    assert _keys_for(["1"]) == keys
+
+
+def test_custom_key_encoder() -> None:
+    """A custom callable is used verbatim; the namespace is not prepended."""
+    store = InMemoryStore()
+    cache = CacheBackedEmbeddings.from_bytes_store(
+        MockEmbeddings(),
+        store,
+        namespace="test_namespace",
+        key_encoder=lambda text: f"custom_{text}",
+    )
+    cache.embed_documents(["1"])
+    assert list(cache.document_embedding_store.yield_keys()) == ["custom_1"]
+
+
+def test_invalid_key_encoder() -> None:
+    with pytest.raises(ValueError, match="Unsupported key encoder"):
+        CacheBackedEmbeddings.from_bytes_store(
+            MockEmbeddings(),
+            InMemoryStore(),
+            namespace="test_namespace",
+            key_encoder="md5",  # type: ignore[arg-type]
+        )
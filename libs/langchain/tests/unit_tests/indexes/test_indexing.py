@@ -21,7 +21,10 @@ from langchain_core.vectorstores import VST, VectorStore
 
 from langchain.indexes import aindex, index
 from langchain.indexes._api import _abatch, _HashedDocument
-from langchain.indexes._sql_record_manager import SQLRecordManager
+from langchain.indexes._sql_record_manager import (
+    _EXISTS_BATCH_SIZE,
+    SQLRecordManager,
+)
 
 
 class ToyLoader(BaseLoader):
@@ -1409,3 +1412,26 @@ async def test_aindexing_custom_batch_size(
         args, kwargs = mock_add_documents.call_args
         assert args == (docs,)
         assert kwargs == {"ids": ids, "batch_size": batch_size}
+
+
+def test_exists_more_keys_than_batch_size(record_manager: SQLRecordManager) -> None:
+    """Key lists larger than one IN-clause batch must not be truncated."""
+    keys = [f"key{i}" for i in range(_EXISTS_BATCH_SIZE * 2 + 100)]
+    existing_keys = keys[::2]
+    record_manager.update(existing_keys)
+    exists = record_manager.exists(keys)
+    assert len(exists) == len(keys)
+    assert exists == [i % 2 == 0 for i in range(len(keys))]
+
+
+@pytest.mark.requires("aiosqlite")
+async def test_aexists_more_keys_than_batch_size(
+    arecord_manager: SQLRecordManager,
+) -> None:
+    """Key lists larger than one IN-clause batch must not be truncated."""
+    keys = [f"key{i}" for i in range(_EXISTS_BATCH_SIZE * 2 + 100)]
+    existing_keys = keys[::2]
+    await arecord_manager.aupdate(existing_keys)
+    exists = await arecord_manager.aexists(keys)
+    assert len(exists) == len(keys)
+    assert exists == [i % 2 == 0 for i in range(len(keys))]
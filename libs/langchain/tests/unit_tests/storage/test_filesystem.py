@@ -153,3 +153,39 @@ def test_catches_forbidden_keys(file_store: LocalFileStore) -> None:
 
     with pytest.raises(InvalidKeyException):
         list(file_store.yield_keys("../etc/passwd"))
+
+
+def test_mset_concurrent() -> None:
+    # The thread-pool write path must be equivalent to the sequential one
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_store = LocalFileStore(temp_dir, max_concurrency=4)
+
+        key_value_pairs = [(f"key{i}", f"value{i}".encode()) for i in range(20)]
+        file_store.mset(key_value_pairs)
+
+        values = file_store.mget([key for key, _ in key_value_pairs])
+        assert values == [value for _, value in key_value_pairs]
+
+
+def test_mset_concurrent_write_error_propagates() -> None:
+    # Errors raised inside pooled writes must surface to the mset caller
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_store = LocalFileStore(temp_dir, max_concurrency=2)
+
+        # Occupy one key's path with a directory so its write fails
+        os.makedirs(os.path.join(str(file_store.root_path), "blocked"))
+        with pytest.raises(IsADirectoryError):
+            file_store.mset([("blocked", b"value1"), ("ok", b"value2")])
+
+
+def test_invalid_max_concurrency() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            LocalFileStore(temp_dir, max_concurrency=0)
+
+
+def test_mset_duplicate_keys_last_value_wins(file_store: LocalFileStore) -> None:
+    # Duplicate keys in one batch are collapsed to a single write of the
+    # last value, matching what sequential overwrites would leave behind
+    file_store.mset([("key1", b"old"), ("key1", b"new")])
+    assert file_store.mget(["key1"]) == [b"new"]
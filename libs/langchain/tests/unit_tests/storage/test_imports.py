@@ -6,6 +6,7 @@ EXPECTED_ALL = [
     "InMemoryByteStore",
     "LocalFileStore",
     "RedisStore",
+    "SQLStore",
     "InvalidKeyException",
     "create_lc_store",
     "create_kv_docstore",
@@ -30,6 +30,7 @@ from langchain_text_splitters.character import (
     CharacterTextSplitter,
     RecursiveCharacterTextSplitter,
 )
+from langchain_text_splitters.content_defined import ContentDefinedTextSplitter
 from langchain_text_splitters.html import (
     ElementType,
     HTMLHeaderTextSplitter,
@@ -73,4 +74,5 @@ __all__ = [
     "MarkdownHeaderTextSplitter",
     "MarkdownTextSplitter",
     "CharacterTextSplitter",
+    "ContentDefinedTextSplitter",
 ]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+from typing import Any, List, Optional
+
+from langchain_text_splitters.base import TextSplitter
+
+# Per-character mixing table for the rolling (gear) hash. Generated from a
+# fixed seed so that chunk boundaries are stable across processes and runs.
+_gear_rng = random.Random(2081)
+_GEAR_TABLE: List[int] = [_gear_rng.getrandbits(32) for _ in range(256)]
+_HASH_MASK = 0xFFFFFFFF
+
+
+class ContentDefinedTextSplitter(TextSplitter):
+    """Splitting text at boundaries chosen by a rolling hash of the content.
+
+    Fixed-size chunking shifts every boundary after an edit, so inserting one
+    sentence near the top of a document changes the content (and hash) of all
+    subsequent chunks. Here a boundary is placed where a rolling hash of the
+    preceding characters matches a fixed bit pattern, so boundaries depend
+    only on nearby content: an edit re-chunks its own neighborhood and the
+    rest of the document produces byte-identical chunks. This raises the hit
+    rate of hash-based deduplication (such as the indexing API) when lightly
+    edited documents are re-ingested.
+
+    Chunks are between ``min_chunk_size`` and ``chunk_size`` characters long
+    and do not overlap; overlapping text would change along with its
+    neighboring chunk and defeat deduplication, so ``chunk_overlap`` is
+    ignored by this splitter.
+    """
+
+    def __init__(self, min_chunk_size: Optional[int] = None, **kwargs: Any) -> None:
+        """Create a new ContentDefinedTextSplitter.
+
+        Args:
+            min_chunk_size: Smallest chunk to emit; no boundary is considered
+                before this many characters. Defaults to a quarter of
+                ``chunk_size``.
+        """
+        kwargs.setdefault("chunk_overlap", 0)
+        super().__init__(**kwargs)
+        if min_chunk_size is None:
+            min_chunk_size = max(self._chunk_size // 4, 1)
+        if not 0 < min_chunk_size <= self._chunk_size:
+            raise ValueError(
+                f"min_chunk_size must be between 1 and chunk_size "
+                f"({self._chunk_size}), got {min_chunk_size}."
+            )
+        self._min_chunk_size = min_chunk_size
+        # A boundary requires this many trailing zero hash bits, so candidate
+        # boundaries occur on average every 2**bits characters past the
+        # minimum, targeting an average chunk size between min and max.
+        spacing = max((self._chunk_size - self._min_chunk_size) // 2, 2)
+        self._boundary_mask = (1 << max(spacing.bit_length() - 1, 1)) - 1
+
+    def split_text(self, text: str) -> List[str]:
+        """Split incoming text and return chunks."""
+        splits: List[str] = []
+        start = 0
+        while len(text) - start > self._chunk_size:
+            end = self._find_boundary(text, start)
+            splits.append(text[start:end])
+            start = end
+        if start < len(text):
+            splits.append(text[start:])
+        if self._strip_whitespace:
+            splits = [split.strip() for split in splits]
+        return [split for split in splits if split]
+
+    def _find_boundary(self, text: str, start: int) -> int:
+        """Return the end index of the chunk starting at ``start``.
+
+        Scans candidate cut points between ``min_chunk_size`` and
+        ``chunk_size`` characters after ``start`` and cuts at the first one
+        whose rolling hash matches the boundary pattern, falling back to a
+        full-size chunk when no candidate matches.
+        """
+        mask = self._boundary_mask
+        first = start + self._min_chunk_size - 1
+        last = start + self._chunk_size
+        hash_ = 0
+        # Warm the hash on the characters leading up to the first candidate
+        # cut; 32 characters is the effective window of the 32-bit gear hash.
+        for i in range(max(first - 32, start), first):
+            hash_ = ((hash_ << 1) + _GEAR_TABLE[ord(text[i]) & 0xFF]) & _HASH_MASK
+        for i in range(first, last):
+            hash_ = ((hash_ << 1) + _GEAR_TABLE[ord(text[i]) & 0xFF]) & _HASH_MASK
+            if hash_ & mask == 0:
+                return i + 1
+        return last
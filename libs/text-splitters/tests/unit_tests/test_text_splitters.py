@@ -17,6 +17,7 @@ from langchain_text_splitters import (
 )
 from langchain_text_splitters.base import split_text_on_tokens
 from langchain_text_splitters.character import CharacterTextSplitter
+from langchain_text_splitters.content_defined import ContentDefinedTextSplitter
 from langchain_text_splitters.html import HTMLHeaderTextSplitter, HTMLSectionSplitter
 from langchain_text_splitters.json import RecursiveJsonSplitter
 from langchain_text_splitters.markdown import (
@@ -1974,3 +1975,49 @@ def test_split_json_many_calls() -> None:
 
     assert chunk0 == chunk0_output
     assert chunk1 == chunk1_output
+
+
+def test_content_defined_splitter_chunk_sizes() -> None:
+    """Chunks respect the configured minimum and maximum sizes."""
+    rng = random.Random(42)
+    text = "".join(rng.choice(string.ascii_lowercase + " ") for _ in range(5000))
+    splitter = ContentDefinedTextSplitter(
+        chunk_size=200, min_chunk_size=50, strip_whitespace=False
+    )
+    chunks = splitter.split_text(text)
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    assert all(len(chunk) >= 50 for chunk in chunks[:-1])
+
+
+def test_content_defined_splitter_stable_under_edits() -> None:
+    """An edit near the start should not re-chunk the rest of the document."""
+    rng = random.Random(7)
+    text = "".join(rng.choice(string.ascii_lowercase + " ") for _ in range(5000))
+    edited = text[:100] + "an inserted sentence. " + text[100:]
+    splitter = ContentDefinedTextSplitter(chunk_size=200, min_chunk_size=50)
+    chunks = splitter.split_text(text)
+    edited_chunks = splitter.split_text(edited)
+    # All chunks past the edit's neighborhood are byte-identical.
+    shared = set(chunks) & set(edited_chunks)
+    assert len(shared) >= len(chunks) - 3
+
+
+def test_content_defined_splitter_deterministic() -> None:
+    """Boundaries only depend on content, not on splitter instances."""
+    text = " ".join(f"word{i}" for i in range(2000))
+    chunks_one = ContentDefinedTextSplitter(chunk_size=300).split_text(text)
+    chunks_two = ContentDefinedTextSplitter(chunk_size=300).split_text(text)
+    assert chunks_one == chunks_two
+
+
+def test_content_defined_splitter_short_text() -> None:
+    """Texts within one chunk are returned whole; empty texts yield nothing."""
+    splitter = ContentDefinedTextSplitter(chunk_size=200, min_chunk_size=50)
+    assert splitter.split_text("short text") == ["short text"]
+    assert splitter.split_text("") == []
+
+
+def test_content_defined_splitter_invalid_min_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        ContentDefinedTextSplitter(chunk_size=100, min_chunk_size=200)